@@ -5,7 +5,6 @@ from logging.handlers import RotatingFileHandler
 import traceback
 import json
 from datetime import datetime
-import diagnostics
 
 
 def setup_logger(
@@ -2,30 +2,101 @@ import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "week1")))
+import asyncio
+import functools
+import hashlib
+import re
+import threading
+
+import diskcache
+import httpx
+import orjson
 import requests
+import tiktoken
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+from selectolax.lexbor import LexborHTMLParser
 import ollama
 
-import validators
+from urllib.parse import urlsplit
 from logger import configured_logger
 
 import tkinter as tk
 import smtplib
+from concurrent.futures import ProcessPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from abc import ABC, abstractmethod
 
 load_dotenv()
 
 
+# Shared session so repeat fetches reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per url.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "Accept-Encoding": "gzip",
+        "User-Agent": "AI-Website-Summarizer/1.0",
+    }
+)
+_RETRIES = requests.adapters.Retry(
+    total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+)
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(
+        _scheme,
+        requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=_RETRIES
+        ),
+    )
+
+# Hard cap on page downloads so a huge response can't exhaust memory.
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+
+def _fetch_content(url):
+    """
+    Fetch a url with retries, a connect/read timeout, and a size cap checked
+    both against the declared Content-Length and the streamed body itself.
+    """
+    response = _SESSION.get(url, timeout=(3, 10), stream=True)
+    response.raise_for_status()
+    if int(response.headers.get("content-length", "0")) > MAX_RESPONSE_BYTES:
+        raise RuntimeError(
+            f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes"
+        )
+    content = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+    if len(content) > MAX_RESPONSE_BYTES:
+        raise RuntimeError(
+            f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes"
+        )
+    return content
+
+# Compiled once: collapse runs of spaces/tabs and excess blank lines so the
+# extracted text doesn't spend prompt tokens on whitespace.
+_WS_RUNS = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parse_pool():
+    """
+    Process pool for HTML parsing, created on first use. Parsing holds the
+    GIL for its Python-level text assembly, so concurrent batches scale it
+    across cores instead of bottlenecking the event loop's thread.
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
 class Website:
-    def __init__(self, url):
+    def __init__(self, url, content=None):
         """
-        Create this Website object from the given url using the BeautifulSoup library
+        Create this Website object from the given url using the selectolax library.
+        If content is provided (e.g. fetched asynchronously), no request is made.
         """
         if not validate_url(url):
             raise ValueError("Invalid URL format")
@@ -33,17 +104,117 @@ class Website:
         self.url = url
 
         try:
-            response = requests.get(url)
-            soup = BeautifulSoup(response.content, "html.parser")
-            self.title = soup.title.string if soup.title else "No title found"
-            for irrelevant in soup.body(["script", "style", "img", "input"]):
-                irrelevant.decompose()
-            self.text = soup.body.get_text(separator="\n", strip=True)
+            if content is None:
+                content = _fetch_content(url)
+            self.title, self.text = self._parse(content)
         except Exception as e:
             raise RuntimeError(
-                f"Error occurred while accessing/parsing url with bs4 --> {str(e)}"
+                f"Error occurred while accessing/parsing url with selectolax --> {str(e)}"
             )
 
+    @staticmethod
+    def _parse(content):
+        """
+        Pure function from raw HTML bytes to (title, text), safe to run in a
+        worker process.
+        """
+        tree = LexborHTMLParser(content)
+        for tag in ("script", "style", "img", "input", "nav", "header", "footer"):
+            for node in tree.css(tag):
+                node.decompose()
+        title_node = tree.css_first("title")
+        title = title_node.text() if title_node else "No title found"
+        text = tree.body.text(separator="\n", strip=True) if tree.body else ""
+        text = _BLANK_LINES.sub("\n\n", _WS_RUNS.sub(" ", text))
+        return title, text
+
+    @classmethod
+    def _from_parts(cls, url, title, text):
+        website = cls.__new__(cls)
+        website.url = url
+        website.title = title
+        website.text = text
+        return website
+
+    @classmethod
+    async def afetch(cls, url, http_client):
+        """
+        Fetch a url with the shared httpx client and build a Website from the
+        response, parsing in the process pool so the event loop stays free.
+        """
+        if not validate_url(url):
+            raise ValueError("Invalid URL format")
+        try:
+            response = await http_client.get(url, follow_redirects=True)
+            response.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"Error occurred while fetching url --> {str(e)}")
+        loop = asyncio.get_running_loop()
+        try:
+            title, text = await loop.run_in_executor(
+                _get_parse_pool(), cls._parse, response.content
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Error occurred while accessing/parsing url with selectolax --> {str(e)}"
+            )
+        return cls._from_parts(url, title, text)
+
+
+class SummaryCache:
+    """
+    Two-tier cache for generated summaries, keyed by model.
+
+    Tier 1 is an exact match on the SHA-256 of the cleaned website text, so
+    re-summarizing an unchanged page skips the LLM entirely. Tier 2 compares
+    a prompt embedding against stored embeddings by cosine similarity, so
+    near-duplicate pages reuse an existing summary.
+    """
+
+    SEMANTIC_THRESHOLD = 0.92
+
+    def __init__(self, directory=".summary_cache", ttl=7 * 24 * 3600):
+        self.cache = diskcache.Cache(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def _exact_key(messages, model):
+        digest = hashlib.sha256(
+            orjson.dumps(messages, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        return f"exact:{model}:{digest}"
+
+    def lookup_exact(self, messages, model):
+        return self.cache.get(self._exact_key(messages, model))
+
+    def lookup_semantic(self, embedding, model):
+        if embedding is None:
+            return None
+        for key in self.cache:
+            if not key.startswith(f"semantic:{model}:"):
+                continue
+            entry = self.cache.get(key)
+            if entry is None:
+                continue
+            stored_embedding, summary = entry
+            similarity = sum(a * b for a, b in zip(embedding, stored_embedding))
+            if similarity > self.SEMANTIC_THRESHOLD:
+                return summary
+        return None
+
+    def store(self, messages, embedding, model, summary):
+        key = self._exact_key(messages, model)
+        self.cache.set(key, summary, expire=self.ttl)
+        if embedding is not None:
+            self.cache.set(
+                key.replace("exact:", "semantic:", 1),
+                (embedding, summary),
+                expire=self.ttl,
+            )
+
+
+summary_cache = SummaryCache()
+
 
 class SummarizationModel(ABC):
 
@@ -51,29 +222,68 @@ class SummarizationModel(ABC):
     def generate_summary(self, model, website: Website):
         pass
 
+    def generate_summary_stream(self, model, website: Website):
+        """
+        Yield summary text deltas as they become available. Models without
+        native streaming fall back to yielding the full summary at once.
+        """
+        yield self.generate_summary(model, website)
+
 
 class OllamaSummarizationModel(SummarizationModel):
 
+    # Keep the model resident between calls so each request doesn't pay a
+    # multi-GB weight reload after the server's default 5-minute idle unload.
+    KEEP_ALIVE = "1h"
+
     def generate_summary(self, model, website: Website):
+        return "".join(self.generate_summary_stream(model, website))
+
+    def generate_summary_stream(self, model, website: Website):
+        """
+        Yield summary deltas as Ollama generates them, so display overlaps
+        generation instead of waiting for the full response.
+        """
         try:
-            response = ollama.chat(model=model, messages=messages_for(website))
-            return response["message"]["content"]
+            stream = ollama.chat(
+                model=model,
+                messages=messages_for(website),
+                keep_alive=self.KEEP_ALIVE,
+                stream=True,
+            )
+            for part in stream:
+                content = part["message"]["content"]
+                if content:
+                    yield content
         except Exception as e:
-            raise RuntimeError(f"API call to OpenAI model failed --> {str(e)}")
+            raise RuntimeError(f"API call to Ollama model failed --> {str(e)}")
 
 
 class OpenAISummarizationModel(SummarizationModel):
 
     def __init__(self):
-        self.openai = initialize_openai()
+        self.openai = get_openai_client()
 
     def generate_summary(self, model, website: Website):
+        messages = messages_for(website)
+
+        cached = summary_cache.lookup_exact(messages, model)
+        if cached is not None:
+            configured_logger.info(f"Summary cache hit (exact) for {website.url}")
+            return cached
+
+        embedding = self._embed_prompt(messages[-1]["content"])
+        cached = summary_cache.lookup_semantic(embedding, model)
+        if cached is not None:
+            configured_logger.info(f"Summary cache hit (semantic) for {website.url}")
+            return cached
+
         try:
-            response = openai_instance.chat.completions.create(
-                model=model, messages=messages_for(website)
+            response = self.openai.chat.completions.create(
+                model=model, messages=messages
             )
             if response.choices and len(response.choices) > 0:
-                return response.choices[0].message.content
+                summary = response.choices[0].message.content
             else:
                 raise RuntimeError(
                     "API response did not contain a valid 'choices' field or it is empty."
@@ -81,6 +291,61 @@ class OpenAISummarizationModel(SummarizationModel):
         except Exception as e:
             raise RuntimeError(f"API call to OpenAI model failed --> {str(e)}")
 
+        summary_cache.store(messages, embedding, model, summary)
+        return summary
+
+    def generate_summary_stream(self, model, website: Website):
+        """
+        Yield summary deltas as OpenAI generates them, so display can start
+        at time-to-first-token instead of waiting for the full completion.
+        Cache hits yield the stored summary as a single delta.
+        """
+        messages = messages_for(website)
+
+        cached = summary_cache.lookup_exact(messages, model)
+        if cached is not None:
+            configured_logger.info(f"Summary cache hit (exact) for {website.url}")
+            yield cached
+            return
+
+        embedding = self._embed_prompt(messages[-1]["content"])
+        cached = summary_cache.lookup_semantic(embedding, model)
+        if cached is not None:
+            configured_logger.info(f"Summary cache hit (semantic) for {website.url}")
+            yield cached
+            return
+
+        parts = []
+        try:
+            stream = self.openai.chat.completions.create(
+                model=model, messages=messages, stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            raise RuntimeError(f"API call to OpenAI model failed --> {str(e)}")
+
+        summary_cache.store(messages, embedding, model, "".join(parts))
+
+    def _embed_prompt(self, prompt):
+        """
+        Embed the prompt for the semantic cache tier. Embeddings from this
+        model are unit-normalized, so dot product equals cosine similarity.
+        """
+        try:
+            response = self.openai.embeddings.create(
+                model="text-embedding-3-small", input=prompt[:8000]
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            configured_logger.warning(
+                f"Failed to embed prompt for semantic cache --> {str(e)}"
+            )
+            return None
+
 
 def summarization_model_factory(model_type: str) -> SummarizationModel:
     if model_type == "openai":
@@ -111,6 +376,10 @@ def log_display_summary(func):
     return wrapper
 
 
+# Translation table that strips whitespace, letting one C-level pass detect it.
+_KEY_WHITESPACE = str.maketrans("", "", " \t\r\n\v\f")
+
+
 def validate_api_key(api_key):
     """
     Validates the API key for proper format and authenticity.
@@ -121,9 +390,9 @@ def validate_api_key(api_key):
             "No API key was found - please head over to the troubleshooting notebook."
         )
 
-    if " " in api_key or "\t" in api_key:
+    if len(api_key.translate(_KEY_WHITESPACE)) != len(api_key):
         raise ValueError(
-            "API key contains spaces or tab characters. Please check your key format."
+            "API key contains whitespace characters. Please check your key format."
         )
 
     return True  # If no exceptions, the API key is valid
@@ -156,34 +425,103 @@ def initialize_openai():
         )
 
 
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """
+    Lazily build the OpenAI client once and share it, so repeated
+    summarizations reuse one validated key and one HTTP connection pool.
+    """
+    return initialize_openai()
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai_client():
+    """
+    Async counterpart of get_openai_client, sharing one AsyncOpenAI client
+    (and its connection pool) across all concurrent summarizations.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    validate_api_key(api_key)
+    return AsyncOpenAI(api_key=api_key)
+
+
 def validate_url(url):
-    """Validate URL format."""
+    """Validate URL format with a cheap scheme + host check."""
     try:
-        return validators.url(url)
-    except:
-        raise RuntimeError(f"Failed to validate website url --> {str(e)}")
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
 
 
 system_prompt = "You are an assistant that analyzes the contents of a website \
 and provides a short summary, ignoring text that might be navigation related. \
 Respond in markdown."
 
+# Kept byte-identical across calls and placed before any page-specific text so
+# repeat requests qualify for the provider's prompt-prefix caching.
+summary_instructions = (
+    "The contents of a website follow in the next message, starting with its"
+    " title. Please provide a short summary of this website in markdown."
+    " If it includes news or announcements, then summarize these too."
+)
 
-def user_prompt_for(website):
-    user_prompt = f"You are looking at a website titled {website.title}"
-    user_prompt += (
-        "\nThe contents of this website is as follows; \please provide a short summary of this website in"
-        " markdown. If it includes news or announcements, then summarize these too.\n\n"
+
+# Built once at import; messages_for only appends the page-specific message.
+_STATIC_MESSAGES = [
+    {"role": "system", "content": system_prompt},
+    {"role": "user", "content": summary_instructions},
+]
+
+
+# Cap on prompt tokens: well inside the model's context window and enough
+# for a short summary, bounding prefill cost and latency.
+MAX_PROMPT_TOKENS = 16_000
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model_name="gpt-4o-mini"):
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=1)
+def _static_prompt_tokens():
+    """
+    Token count of the static prompt parts, encoded once per process. Lazy so
+    importing the module never triggers tiktoken's BPE download; the first
+    network touch happens at the first LLM call, where failures are handled.
+    """
+    return sum(
+        len(_get_encoding().encode(part))
+        for part in (system_prompt, summary_instructions)
+    )
+
+
+def truncate_to_token_limit(text, limit):
+    """
+    Truncate text to at most limit tokens so long pages can't exceed the
+    model's context window or inflate prefill cost.
+    """
+    encoding = _get_encoding()
+    tokens = encoding.encode(text)
+    if len(tokens) <= limit:
+        return text
+    configured_logger.info(
+        f"Truncating page text from {len(tokens)} to {limit} tokens"
     )
-    user_prompt += website.text
-    return user_prompt
+    return encoding.decode(tokens[:limit])
+
+
+def user_prompt_for(website):
+    budget = MAX_PROMPT_TOKENS - _static_prompt_tokens()
+    return f"Title: {website.title}\n\n{truncate_to_token_limit(website.text, budget)}"
 
 
 def messages_for(website):
-    return [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt_for(website)},
-    ]
+    return _STATIC_MESSAGES + [{"role": "user", "content": user_prompt_for(website)}]
 
 
 class Display(ABC):
@@ -191,12 +529,32 @@ class Display(ABC):
     def handle_result(self, summary: str):
         pass
 
+    def handle_stream(self, chunks):
+        """
+        Consume an iterable of summary text deltas. Strategies that cannot
+        render incrementally accumulate the full summary and display it once.
+        """
+        summary = "".join(chunks)
+        self.handle_result(summary)
+        return summary
+
 
 class RichConsoleStrategy(Display):
+    # Console construction probes the terminal's capabilities; build it once
+    # and share it across every summary this strategy displays.
+    _console = Console()
+
     def handle_result(self, summary):
-        console = Console()
         content = Markdown(summary)
-        console.print(content)
+        self._console.print(content)
+
+    def handle_stream(self, chunks):
+        parts = []
+        with Live(Markdown(""), console=self._console, refresh_per_second=10) as live:
+            for delta in chunks:
+                parts.append(delta)
+                live.update(Markdown("".join(parts)))
+        return "".join(parts)
 
 
 class WriteToFileStrategy(Display):
@@ -225,14 +583,22 @@ class PrintToConsoleStrategy(Display):
 class DisplayInGUIWindowStrategy(Display):
     def handle_result(self, summary):
         try:
-            window = tk.Tk()
-            window.title("Summary Report")
-            label = tk.Label(window, text=summary, padx=20, pady=20)
-            label.pack()
-            window.mainloop()
+            # Run the Tk event loop in a daemon thread so mainloop() doesn't
+            # block the rest of the summarization pipeline.
+            threading.Thread(
+                target=self._show_window, args=(summary,), daemon=True
+            ).start()
         except Exception as e:
             raise RuntimeError(f"Failed to display summary in GUI window --> {str(e)}")
 
+    @staticmethod
+    def _show_window(summary):
+        window = tk.Tk()
+        window.title("Summary Report")
+        label = tk.Label(window, text=summary, padx=20, pady=20)
+        label.pack()
+        window.mainloop()
+
 
 class SendToEmailStrategy(Display):
     def __init__(
@@ -246,6 +612,32 @@ class SendToEmailStrategy(Display):
         self.sender_email = sender_email
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        # Authenticated connection reused across sends; STARTTLS + login is
+        # the dominant per-send cost, so pay it once instead of every time.
+        self._server = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+
+        # Start TLS (Transport Layer Security) to secure the connection
+        server.starttls()
+
+        # Login to the server with the sender's email and password
+        server.login(
+            self.sender_email, "<Your_Email_Password>"
+        )  # Replace with the correct password or app-specific password
+        return server
+
+    def _get_server(self):
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPException, OSError):
+                self._server = None
+        self._server = self._connect()
+        return self._server
 
     def handle_result(self, summary):
         try:
@@ -256,16 +648,8 @@ class SendToEmailStrategy(Display):
 
             msg.attach(MIMEText(summary, "plain"))
 
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                # Start TLS (Transport Layer Security) to secure the connection
-                server.starttls()
-
-                # Login to the server with the sender's email and password
-                server.login(
-                    self.sender_email, "<Your_Email_Password>"
-                )  # Replace with the correct password or app-specific password
-
-                # Send the email
+            with self._lock:
+                server = self._get_server()
                 server.sendmail(
                     self.sender_email, self.recipient_email, msg.as_string()
                 )
@@ -279,17 +663,106 @@ class SendToEmailStrategy(Display):
 def display_summary(url, model_type, model_name, strategy: Display = None):
     website = Website(url)
     summarization_model = summarization_model_factory(model_type)
-    summary = summarization_model.generate_summary(model_name, website)
-    if strategy:
-        strategy.handle_result(summary)
-    else:
-        PrintToConsoleStrategy().handle_result(summary)
+    chunks = summarization_model.generate_summary_stream(model_name, website)
+    if strategy is None:
+        strategy = PrintToConsoleStrategy()
+    strategy.handle_stream(chunks)
+
+
+async def _summarize_website(website, openai_client, model_name):
+    try:
+        response = await openai_client.chat.completions.create(
+            model=model_name, messages=messages_for(website)
+        )
+        return response.choices[0].message.content
+    except Exception as e:
+        raise RuntimeError(f"API call to OpenAI model failed --> {str(e)}")
+
+
+async def summarize_async(url, http_client, model_name):
+    # First call warms the shared client (env read + key validation) while
+    # the page fetch is in flight; afterwards the lru_cache makes it free.
+    website, openai_client = await asyncio.gather(
+        Website.afetch(url, http_client),
+        asyncio.to_thread(get_async_openai_client),
+    )
+    return await _summarize_website(website, openai_client, model_name)
+
+
+async def _assign_duplicate_clusters(websites, openai_client, threshold):
+    """
+    Embed all page texts in one batch call and greedily cluster them by
+    cosine similarity. Returns, for each website, the index of the cluster
+    representative whose summary it can reuse (its own index if unique).
+    """
+    try:
+        response = await openai_client.embeddings.create(
+            model="text-embedding-3-small",
+            input=[website.text[:8000] for website in websites],
+        )
+        embeddings = [item.embedding for item in response.data]
+    except Exception as e:
+        configured_logger.warning(
+            f"Failed to batch-embed pages for dedup --> {str(e)}"
+        )
+        return list(range(len(websites)))
+
+    representatives = []
+    assignment = []
+    for i, embedding in enumerate(embeddings):
+        for rep in representatives:
+            similarity = sum(a * b for a, b in zip(embedding, embeddings[rep]))
+            if similarity > threshold:
+                assignment.append(rep)
+                break
+        else:
+            representatives.append(i)
+            assignment.append(i)
+    return assignment
+
+
+async def summarize_urls(urls, model_name, max_concurrent=8, dedup_threshold=0.92):
+    """
+    Summarize many urls concurrently; network latency for fetches and LLM
+    calls overlaps instead of serializing, bounded by a semaphore to stay
+    within OpenAI rate limits. Near-duplicate pages (mirrors, AMP copies,
+    tracking-parameter variants) are detected with one batch embedding call
+    and share a single LLM summary per cluster.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async with httpx.AsyncClient() as http_client:
+
+        async def bounded_fetch(url):
+            async with semaphore:
+                return await Website.afetch(url, http_client)
+
+        websites = await asyncio.gather(*(bounded_fetch(url) for url in urls))
+
+        openai_client = get_async_openai_client()
+        assignment = await _assign_duplicate_clusters(
+            websites, openai_client, dedup_threshold
+        )
+
+        summaries = {}
+
+        async def bounded_summarize(index):
+            async with semaphore:
+                summaries[index] = await _summarize_website(
+                    websites[index], openai_client, model_name
+                )
+
+        await asyncio.gather(*(bounded_summarize(i) for i in sorted(set(assignment))))
+        return [summaries[rep] for rep in assignment]
 
 
-console_strategy = RichConsoleStrategy()
-file_strategy = WriteToFileStrategy(file_path="week1/summary.md")
-raw_print_strategy = PrintToConsoleStrategy()
-gui_window_strategy = DisplayInGUIWindowStrategy()
-mail_strategy = SendToEmailStrategy("recipient@gmail.com", "sender@gmail.com")
+# Guarded so process-pool workers re-importing this module (spawn/forkserver
+# start methods) don't re-run the live fetch and LLM call at import.
+if __name__ == "__main__":
+    console_strategy = RichConsoleStrategy()
+    file_strategy = WriteToFileStrategy(file_path="week1/summary.md")
+    raw_print_strategy = PrintToConsoleStrategy()
+    gui_window_strategy = DisplayInGUIWindowStrategy()
+    mail_strategy = SendToEmailStrategy("recipient@gmail.com", "sender@gmail.com")
 
-display_summary("https://edwarddonner.com", "ollama","llama3.2", console_strategy)
+    display_summary("https://edwarddonner.com", "ollama", "llama3.2", console_strategy)